@@ -4,7 +4,10 @@ creature.py
 Creatures for combat and information.
 
 Constants:
-EMPHASIS_REGEX: A regex matching emphasized text in markdown. (Pattern)
+ATTACK_REGEX: A regex splitting an attack into type, bonus, range, and hit text. (Pattern)
+DAMAGE_REGEX: A regex matching a damage roll and the damage type. (Pattern)
+EMPHASIS_REGEXES: Regexes matching emphasized text in markdown, by delimiter. (dict of str: Pattern)
+LINE_REGEX: A regex classifying the start of a creature's text line. (Pattern)
 
 Classes:
 Attack: An attack used by a creature. (object)
@@ -12,14 +15,35 @@ Creature: A creature for combat or information. (object)
 CreatureGroup: A grouping of similar creatures. (object)
 DummyNode: A fake header node for creating blank creatures. (namedtuple)
 ParsingError: A custom error from parsing problems. (Exception)
+
+Functions:
+_emphasis_match: Match emphasized text at the start of a line. (Match or None)
 """
 
 import collections
+import itertools
 import re
+import sys
 
 from . import dice
 
-EMPHASIS_REGEX = re.compile(r'(?P<em>\*{1,3}|_{1,3})([^\*_]+?)(?P=em)')
+ATTACK_REGEX = re.compile(r'(.*?)Attack:\*\s*([+-]?\d+)[^,]*,(.*?)\*Hit:\*(.*)', re.DOTALL)
+DAMAGE_REGEX = re.compile(r'(?<!\S)\(([^)]*)\)\s+(\S+)')
+EMPHASIS_REGEXES = {'*': re.compile(r'(\*{1,3})([^*_]+)\1'), '_': re.compile(r'(_{1,3})([^*_]+)\1')}
+LINE_REGEX = re.compile(r'(?P<size>\*(?:Tiny|Smal|Medi|Larg|Huge|Garg))|(?P<abilities>\| STR)')
+
+def _emphasis_match(line):
+	"""
+	Match emphasized text at the start of a line. (Match or None)
+
+	Only the pattern for the line's first character is tried, so lines that do
+	not start with a delimiter never reach the regex engine.
+
+	Parameters:
+	line: The line of markdown text to match. (str)
+	"""
+	regex = EMPHASIS_REGEXES.get(line[:1])
+	return regex.match(line) if regex else None
 
 class Attack(object):
 	"""
@@ -29,6 +53,9 @@ class Attack(object):
 	damage roll, and the type of damage done.
 
 	Attributes:
+	_damage_rolls: The damage, with the rolls parsed if possible. (list of tuple)
+	_repr_text: The cached debugging text, if built yet. (str or None)
+	_str_text: The cached human readable text, if built yet. (str or None)
 	additional: A description of any additional effects of the attack. (str)
 	bonus: The attack bonus for the attack. (int)
 	damage: The damage done by the attack. (list of (str, str))
@@ -45,6 +72,7 @@ class Attack(object):
 	attack: Make the attack. (tuple of int, str)
 	base_text: Base text for string representations. (str)
 	full_text: Full text representation. (str)
+	roll_damage: Roll the damage for a hit. (list of int)
 
 	Overridden Methods:
 	__init__
@@ -52,6 +80,9 @@ class Attack(object):
 	__str__
 	"""
 
+	__slots__ = ('_damage_rolls', '_repr_text', '_str_text', 'additional', 'bonus', 'damage', 'melee', 
+		'name', 'or_damage', 'range', 'ranged', 'spell', 'text')
+
 	def __init__(self, title, text):
 		"""
 		A temporary initializer for testing. (None)
@@ -63,57 +94,41 @@ class Attack(object):
 		# Set the text attributes.
 		self.name = title
 		self.text = text
+		# Split the attack into its parts.
+		match = ATTACK_REGEX.match(self.text)
+		if not match:
+			raise ValueError(f'Could not parse the {title} attack.')
+		attack_type, bonus_text, range_text, hit_rest = match.groups()
 		# Parse the attack type attributes.
-		self.melee = 'Melee' in self.text
-		self.ranged = 'Ranged' in self.text
-		self.spell = 'Spell' in self.text
-		self.or_damage = False
-		# Get the attack bonus.
-		attack = self.text.index('Attack:*') + 8
-		bonus_word = self.text[attack:].split()[0]
-		self.bonus = int(bonus_word.strip('+'))
-		# Get the range or reach.
-		comma = self.text.index(',', attack) + 1
-		hit = self.text.index('*Hit:*')
-		self.range = self.text[comma:hit].strip(' .')
+		self.melee = 'Melee' in attack_type
+		self.ranged = 'Ranged' in attack_type
+		self.spell = 'Spell' in attack_type
+		# Get the attack bonus, and the range or reach.
+		self.bonus = int(bonus_text)
+		self.range = range_text.strip(' .')
 		# Parse the hit text.
-		hit += 6
-		period = self.text.index('.', hit)
-		hit_text = self.text[hit:period]
-		self.damage = []
-		roll = ''
-		roll_done = False
-		for word in hit_text.split():
-			# Check for start of damage roll.
-			if word.startswith('('):
-				if word.endswith(')'):
-					roll = word[1:-1]
-					roll_done = True
-				else:
-					roll = word[1:]
-			# Pick up the word after the damage roll as the damage type.
-			elif roll_done:
-				self.damage.append((roll, word))
-				roll = ''
-				roll_done = False
-			# Check for the end of a damage roll with a space in it.
-			elif roll:
-				if word.endswith(')'):
-					roll += word[:-1]
-					roll_done = True
-				else:
-					roll += word
-			# Check for different damage rolls as opposed to multiple damage rolls.
-			elif word == 'or':
-				self.or_damage = True
+		hit_text, period, after_hit = hit_rest.partition('.')
+		# The rolls and damage types repeat across the bestiary, so share them.
+		self.damage = [(sys.intern(''.join(roll.split())), sys.intern(damage)) 
+			for roll, damage in DAMAGE_REGEX.findall(hit_text)]
+		# Check for different damage rolls as opposed to multiple damage rolls.
+		self.or_damage = ' or ' in hit_text
 		# Get any additional effects.
-		if not self.damage:
+		if self.damage:
+			self.additional = after_hit.strip()
+		else:
 			# Roll back one sentence.
-			period = hit
-		self.additional = self.text[(period + 1):].strip()
+			self.additional = hit_rest.strip()
+		# Parse the damage rolls ahead of time for speed.
+		self._damage_rolls = [(roll, dice.parse_roll(roll), damage) for roll, damage in self.damage]
+		# The text representations are built when first asked for.
+		self._repr_text = None
+		self._str_text = None
 
 	def __repr__(self):
 		"""Debugging text representation. (str)"""
+		if self._repr_text is not None:
+			return self._repr_text
 		damage_bits = [f'{roll} {damage_type}' for roll, damage_type in self.damage]
 		if self.or_damage:
 			damage_text = ' or '.join(damage_bits)
@@ -121,13 +136,16 @@ class Attack(object):
 			damage_text = ', '.join(damage_bits)
 		more_text = '...' if self.additional else ''
 		space = ' ' if self.damage and self.additional else ''
-		return f'<Attack {self.name} {self.bonus} {damage_text}{space}{more_text}>'
+		self._repr_text = f'<Attack {self.name} {self.bonus} {damage_text}{space}{more_text}>'
+		return self._repr_text
 
 	def __str__(self):
 		"""Human readable text representation. (str)"""
-		base_text = self.base_text()
-		more_text = ' and more' if self.additional else ''
-		return f'{base_text}{more_text}'
+		if self._str_text is None:
+			base_text = self.base_text()
+			more_text = ' and more' if self.additional else ''
+			self._str_text = f'{base_text}{more_text}'
+		return self._str_text
 
 	def add_text(self, text):
 		"""
@@ -137,6 +155,9 @@ class Attack(object):
 		text: The extra explanatory text. (str)
 		"""
 		self.additional = '{} {}'.format(self.additional, text)
+		# Clear the cached text representations.
+		self._repr_text = None
+		self._str_text = None
 
 	def attack(self, target, advantage = 0, temp_bonus = 0):
 		"""
@@ -157,33 +178,36 @@ class Attack(object):
 			target_ac = 1
 		else:
 			target_ac = target.ac + target.ac_mod
+		# Determine the result of the attack roll.
+		fumble = hit_roll == 1
+		critical = hit_roll == 20
+		hit = not fumble and (critical or hit_roll + total_bonus >= target_ac)
 		# Handle fumbles.
-		if hit_roll == 1:
+		if fumble:
 			total = 0
 			text = 'Fumble'
 		# Handle hits.
-		elif hit_roll == 20 or hit_roll + total_bonus >= target_ac:
+		elif hit:
 			# Get the damage.
+			sub_totals = self.roll_damage(critical)
 			text_bits = []
-			total = 0
-			for roll, damage in self.damage:
-				sub_total = dice.roll(roll)
-				if hit_roll == 20:
-					sub_total += dice.roll(roll)
+			for sub_total, (roll, parsed, damage) in zip(sub_totals, self._damage_rolls):
 				s = '' if sub_total == 1 else 's'
 				text_bits.append(f'{sub_total} point{s} of {damage} damage')
-				if self.or_damage:
-					total = sub_total
-				else:
-					total += sub_total
+			if self.or_damage and sub_totals:
+				total = sub_totals[-1]
+			else:
+				total = sum(sub_totals)
 			if target is not None:
 				target.hit(total)
 				print(f'{target.name.title()} has {target.hp} hit points left.')
 			# Create the text description.
-			if target is None:
-				hit_type = 'Critical hit' if hit_roll == 20 else f'Hits AC {hit_roll + total_bonus}'
+			if critical:
+				hit_type = 'Critical hit'
+			elif target is None:
+				hit_type = f'Hits AC {hit_roll + total_bonus}'
 			else:
-				hit_type = 'Critical hit' if hit_roll == 20 else f'Hit ({hit_roll} + {total_bonus})'
+				hit_type = f'Hit ({hit_roll} + {total_bonus})'
 			if len(text_bits) == 1:
 				text = f'{hit_type} for {text_bits[0]}'
 			else:
@@ -218,6 +242,26 @@ class Attack(object):
 		else:
 			return base_text
 
+	def roll_damage(self, critical = False):
+		"""
+		Roll the damage for a hit. (list of int)
+
+		The return value is the total for each of the damage rolls, in order. This
+		is just the numbers, without any of the text describing the attack.
+
+		Parameters:
+		critical: A flag for the hit being a critical hit. (bool)
+		"""
+		sub_totals = []
+		for roll, parsed, damage in self._damage_rolls:
+			# Use the pre-parsed roll if there is one.
+			roller, spec = (dice.roll_parsed, parsed) if parsed else (dice.roll, roll)
+			sub_total = roller(spec)
+			if critical:
+				sub_total += roller(spec)
+			sub_totals.append(sub_total)
+		return sub_totals
+
 class Creature(object):
 	"""
 	A creature for combat or information. (object)
@@ -226,6 +270,12 @@ class Creature(object):
 	Manual.
 
 	Attributes:
+	_attack_list: The creature's attacks, in order. (tuple of Attack)
+	_attack_names: The creature's attacks by lower case name. (dict of str: Attack)
+	_combat_lines: The unchanging lines of the combat text. (tuple of str)
+	_hp_parsed: The parsed hit point roll, if it is a simple roll. (tuple of int or None)
+	_name_markers: The case folded forms of the emphasized name. (tuple of str)
+	_stat_lines: The unchanging lines of the stat block, once built. (tuple of str or None)
 	abilities: The creature's ability scores. (dict of str: int)
 	ac: The creature's armor class. (str)
 	ac_mod: Any temporary modifier to armor class. (str)
@@ -248,7 +298,6 @@ class Creature(object):
 	language: The languages the creature can speak. (str)
 	legendary: Legendary actions the creature can take. (dict of str: str)
 	name: The creature's name. (str)
-	name_regex: A regular expression for the creature's name emphasized. (Pattern)
 	other_speeds: The creature's non-walking speeds, if any. (str)
 	pc: A flag for the creature being a player character. (bool)
 	reactions: The text for the creature's reactions. (dict of str: str)
@@ -261,12 +310,18 @@ class Creature(object):
 	xp: The creature's experience point value. (int)
 
 	Class Attributes:
-	letters: Letters for identifying attacks. (str)
+	ability_names: The abbreviations of the abilities, in order. (tuple of str)
+	default_abilities: The ability scores for a creature without any. (dict of str: int)
+	default_bonuses: The ability bonuses for a creature without any. (dict of str: int)
+	default_skills: The skill bonuses for a creature without any. (dict of str: int)
+	score_bonuses: The ability bonus for each ability score up to 30. (tuple of int)
 	sizes: The valid starts of the size/type/alignment line. (tuple of str)
 	skill_abilities: The ability bonus for each skill. (tuple of str: str)
-	two_start: Parser names for lines starting with '**'. (dict of str: str)
+	skill_indexes: Each skill with the index of its ability. (tuple of (str, int))
+	two_stars: Parsers for lines starting with '**'. (dict of str: function)
 
 	Methods:
+	_add_paragraphs: Add loose paragraphs to the end of a parsed entry. (None)
 	_parse_abilities: Parse the creature's ability scores and bonuses. (None)
 	_parse_ac: Parse the creature's armor class. (None)
 	_parse_action: Parse one of the creature's actions. (None)
@@ -283,7 +338,9 @@ class Creature(object):
 	_parse_size: Parse the creature's size, type, sub-type, and alignment. (None)
 	_parse_skills: Parse the creature's skill bonuses. (None)
 	_parse_speed: Parse the creature's movement speed. (None)
+	_set_combat_lines: Set the lines of the combat text that do not change. (None)
 	_set_defaults: Set the default attributes for a creature. (None)
+	_set_stat_lines: Set the lines of the stat block that do not change. (None)
 	auto_attack: Do all attacks without a target. (str)
 	attack: Attack something. (tuple of int, text)
 	combat_text: Text representation for their turn in combat. (str)
@@ -302,16 +359,23 @@ class Creature(object):
 	__str__
 	"""
 
-	letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+	__slots__ = ('_attack_list', '_attack_names', '_combat_lines', '_hp_parsed', '_name_markers', '_stat_lines', 
+		'abilities', 'ac', 'ac_mod', 'ac_text', 'actions', 'alignment', 'attacks', 'bonuses', 'conditions', 'cr', 'description', 
+		'features', 'hp', 'hp_max', 'hp_roll', 'hp_temp', 'init_bonus', 'initiative', 'languages', 
+		'legendary', 'name', 'other_speeds', 'pc', 'reactions', 'saves', 'senses', 'size', 'skills', 'speed', 
+		'sub_type', 'type', 'xp')
+	ability_names = ('str', 'dex', 'con', 'int', 'wis', 'cha')
 	sizes = ('*Tiny', '*Smal', '*Medi', '*Larg', '*Huge', '*Garg')
 	skill_abilities = {'acrobatics': 'dex', 'arcana': 'int', 'animal-handling': 'wis', 'athletics': 'str',
 		'deception': 'cha', 'history': 'int', 'insight': 'wis', 'intimidation': 'cha', 
 		'investigation': 'int', 'medicine': 'wis', 'nature': 'int', 'perception': 'wis', 
 		'performance': 'cha', 'persuasion': 'cha', 'religion': 'int', 'sleight-of-hand': 'dex', 
 		'stealth': 'dex', 'survival': 'wis'}
-	two_stars = {'Armor Class': '_parse_ac', 'Challenge': '_parse_challenge', 'Hit Points': '_parse_hp', 
-		'Languages': '_parse_languages', 'Saving Throws': '_parse_saves', 'Senses': '_parse_senses', 
-		'Skills': '_parse_skills', 'Speed': '_parse_speed'}
+	skill_indexes = tuple(zip(skill_abilities, map(ability_names.index, skill_abilities.values())))
+	default_abilities = dict.fromkeys(ability_names, 10)
+	default_bonuses = dict.fromkeys(ability_names, 0)
+	default_skills = dict.fromkeys(skill_abilities, 0)
+	score_bonuses = tuple(score // 2 - 5 for score in range(31))
 
 	def __init__(self, node):
 		"""
@@ -322,7 +386,8 @@ class Creature(object):
 		"""
 		# Set the creature's name.
 		self.name = node.name.strip()
-		self.name_regex = re.compile(r'\*\*{}e?s?\*\*'.format(self.name), re.IGNORECASE)
+		name = self.name.casefold()
+		self._name_markers = tuple(f'**{name}{end}**' for end in ('', 's', 'es', 'e'))
 		# Set the creature's default attributes.
 		self._set_defaults()
 		# Loop through the node content.
@@ -334,6 +399,11 @@ class Creature(object):
 					self._parse_header(node)
 				except:
 					raise ParsingError(f'Error parsing {self.name} in header {node.name!r}.')
+		# Index the attacks for quick lookup.
+		self._attack_list = tuple(self.attacks.values())
+		self._attack_names = {attack.name.lower(): attack for attack in self._attack_list}
+		# Set the parts of the combat text that are only parsed.
+		self._set_combat_lines()
 
 	def __repr__(self):
 		"""Debugging text representation. (str)"""
@@ -346,6 +416,27 @@ class Creature(object):
 			text = '{}; {}'.format(text, ', '.join([con[0] for con in self.conditions]))
 		return text
 
+	def _add_paragraphs(self, target, key, paragraphs):
+		"""
+		Add loose paragraphs to the end of a parsed entry. (None)
+
+		The paragraphs are collected while parsing and added all at once, rather 
+		than rebuilding the entry's text for each paragraph.
+
+		Parameters:
+		target: The dict with the entry, or 'description'. (dict or str)
+		key: The key of the entry in the target dict. (str)
+		paragraphs: The loose paragraphs to add. (list of str)
+		"""
+		if not paragraphs:
+			return
+		if target == 'description':
+			self.description = '\n\n'.join([self.description] + paragraphs)
+		elif target is self.attacks:
+			target[key].add_text(' '.join(paragraphs))
+		else:
+			target[key] = '\n\n'.join([target[key]] + paragraphs)
+
 	def _parse_abilities(self, line):
 		"""
 		Parse the creature's ability scores and related bonuses. (None)
@@ -353,18 +444,19 @@ class Creature(object):
 		Parameters:
 		line: The line of text with the creature's ability scores. (str)
 		"""
-		# Set up the attribute dicts.
-		self.abilities, self.bonuses, self.saves, self.skills = {}, {}, {}, {}
 		# Get the abilities, with bonuses and default saves.
 		cells = line.split('|')
-		for ability, text in zip(('str', 'dex', 'con', 'int', 'wis', 'cha'), cells[1:]):
-			score = int(text.split()[0])
-			self.abilities[ability] = score
-			self.bonuses[ability] = score // 2 - 5
-			self.saves[ability] = score // 2 - 5
+		scores = [int(text.split()[0]) for text in cells[1:7]]
+		# Look up the usual scores, but calculate any out of range (homebrew) scores.
+		if 0 <= min(scores) and max(scores) <= 30:
+			bonuses = [self.score_bonuses[score] for score in scores]
+		else:
+			bonuses = [score // 2 - 5 for score in scores]
+		self.abilities = dict(zip(self.ability_names, scores))
+		self.bonuses = dict(zip(self.ability_names, bonuses))
+		self.saves = self.bonuses.copy()
 		# Get the default skill bonuses.
-		for skill, ability in self.skill_abilities.items():
-			self.skills[skill] = self.bonuses[ability]
+		self.skills = {skill: bonuses[ability_index] for skill, ability_index in self.skill_indexes}
 		# Set the initiative bonus.
 		self.init_bonus = self.bonuses['dex']
 
@@ -426,60 +518,67 @@ class Creature(object):
 		"""Parse special headers in the creature description. (None)"""
 		last_key = ''
 		last_dict = None
+		paragraphs = []
+		# Run through the lines of all of the section's paragraphs as one sequence.
+		lines = itertools.chain.from_iterable(child.lines for child in node.children)
 		# Search through the actions section.
 		if node.name.strip() == 'Actions':
-			for child in node.children:
-				for line in child.lines:
-					match = EMPHASIS_REGEX.match(line)
-					# Handle named actions.
-					if match:
-						blank, name, text = line.split(match.group(1), 2)
-						last_dict, last_key = self._parse_action(name, text)
-					# Add unnamed actions to the last action.
-					elif line.strip():
-						if self.name_regex.search(line):
-							self.description = line
-							last_dict = 'description'
-						elif last_dict == 'description':
-							self.description = f'{self.description}\n\n{line}'
-						elif last_dict == self.actions:
-							last_dict[last_key] = '{}\n\n{}'.format(last_dict[last_key], line)
-						else:
-							last_dict[last_key].add_text(line)
+			for line in lines:
+				match = _emphasis_match(line)
+				# Handle named actions.
+				if match:
+					self._add_paragraphs(last_dict, last_key, paragraphs)
+					paragraphs = []
+					name, text = match.group(2), line[match.end():]
+					last_dict, last_key = self._parse_action(name, text)
+				# Add unnamed actions to the last action.
+				elif line.strip():
+					line_folded = line.casefold()
+					if any(marker in line_folded for marker in self._name_markers):
+						self._add_paragraphs(last_dict, last_key, paragraphs)
+						paragraphs = []
+						self.description = line
+						last_dict = 'description'
+					elif last_dict is None:
+						raise ValueError('Unnamed action with no previous action.')
+					else:
+						paragraphs.append(line)
 		# Search through the actions section.
 		if node.name == 'Reactions':
-			for child in node.children:
-				for line in child.lines:
-					match = EMPHASIS_REGEX.match(line)
-					# Handle named actions.
-					if match:
-						blank, name, text = line.split(match.group(1), 2)
-						last_dict, last_key = self._parse_reaction(name, text)
-					# Add unnamed actions to the last action.
-					elif line.strip():
-						if last_dict == self.reactions:
-							last_dict[last_key] = '{}\n\n{}'.format(last_dict[last_key], line)
-						else:
-							last_dict[last_key].add_text(line)
+			for line in lines:
+				match = _emphasis_match(line)
+				# Handle named actions.
+				if match:
+					self._add_paragraphs(last_dict, last_key, paragraphs)
+					paragraphs = []
+					name, text = match.group(2), line[match.end():]
+					last_dict, last_key = self._parse_reaction(name, text)
+				# Add unnamed actions to the last action.
+				elif line.strip():
+					if last_dict is None:
+						raise ValueError('Unnamed reaction with no previous reaction.')
+					paragraphs.append(line)
 		# Search through the legendary actions section, if any.
 		elif node.name == 'Legendary Actions':
-			last_key = ''
-			for child in node.children:
-				for line in child.lines:
-					match = EMPHASIS_REGEX.match(line)
-					# Handle named actions.
-					if match:
-						blank, name, text = line.split(match.group(1), 2)
-						last_key = self._parse_legendary(name, text)
-					# Check for loose paragraphs.
-					elif line.strip():
-						# Add to previous legendary actions.
-						if last_key:
-							new_text = '{}\n\n{}'.format(self.legendary[last_key], line)
-							self.legendary[last_key] = new_text
-						# Assume the first one describes legendary actions in general.
-						else:
-							self.legendary['Legendary Actions'] = line
+			last_dict = self.legendary
+			for line in lines:
+				match = _emphasis_match(line)
+				# Handle named actions.
+				if match:
+					self._add_paragraphs(last_dict, last_key, paragraphs)
+					paragraphs = []
+					name, text = match.group(2), line[match.end():]
+					last_key = self._parse_legendary(name, text)
+				# Check for loose paragraphs.
+				elif line.strip():
+					# Add to previous legendary actions.
+					if last_key:
+						paragraphs.append(line)
+					# Assume the first one describes legendary actions in general.
+					else:
+						self.legendary['Legendary Actions'] = line
+		# Add any paragraphs left over at the end.
+		self._add_paragraphs(last_dict, last_key, paragraphs)
 
 	def _parse_hp(self, title, text):
 		"""
@@ -493,6 +592,7 @@ class Creature(object):
 		parts = text.split('(')
 		self.hp = int(parts[0])
 		self.hp_roll = parts[1].strip(') ')
+		self._hp_parsed = dice.parse_roll(self.hp_roll)
 		# Set the secondary hit point attributes.
 		self.hp_max = self.hp
 		self.hp_temp = 0
@@ -521,6 +621,8 @@ class Creature(object):
 	def _parse_lines(self, node):
 		"""Parse the lines of a text node. (None)"""
 		abilities = False
+		last_dict, last_key = None, ''
+		paragraphs = []
 		for line in node.lines:
 			try:
 				# Check for abilities.
@@ -528,26 +630,36 @@ class Creature(object):
 					if line[1] != '-':
 						self._parse_abilities(line)
 						abilities = False
+					continue
+				# Classify the line by how it starts (only size and ability lines need checking).
+				line_start = LINE_REGEX.match(line) if line[:1] in ('*', '|') else None
+				line_type = line_start.lastgroup if line_start else ''
 				# Check for the starting size line.
-				elif line[:5] in self.sizes:
+				if line_type == 'size':
 					self._parse_size(line)
 				# Check for starting to check for abilities.
-				elif line.startswith('| STR'):
+				elif line_type == 'abilities':
 					abilities = True
 				else:
 					# Check for a line starting with emphasized text.
-					match = EMPHASIS_REGEX.match(line)
+					match = _emphasis_match(line)
 					if match:
-						blank, title, text = line.split(match.group(1))
-						last = getattr(self, self.two_stars.get(title, '_parse_feature'))(title, text)
+						self._add_paragraphs(last_dict, last_key, paragraphs)
+						paragraphs = []
+						title, text = match.group(2), line[match.end():]
+						last = self.two_stars.get(title, Creature._parse_feature)(self, title, text)
 						if last is not None:
 							last_dict, last_key = last
-					# Append loose paragraphs to the last feature found.
+					# Save loose paragraphs for the last feature found.
 					elif line.strip():
-						last_dict[last_key] = '{}\n\n{}'.format(last_dict[last_key], line)
+						if last_dict is None:
+							raise ValueError('Loose paragraph with no previous feature.')
+						paragraphs.append(line)
 			except:
 				words = ' '.join(line.split()[:3])
 				raise ParsingError(f'Error parsing {self.name} on line starting with {words!r}.')
+		# Add the loose paragraphs to the last feature found.
+		self._add_paragraphs(last_dict, last_key, paragraphs)
 
 	def _parse_reaction(self, name, text):
 		"""
@@ -639,12 +751,28 @@ class Creature(object):
 			self.speed = int(text.split()[0])
 			self.other_speeds = ''
 
+	def _set_combat_lines(self):
+		"""Set the lines of the combat text that do not change. (None)"""
+		lines = []
+		# Set up features:
+		if self.features:
+			lines.append('Features: {}'.format(', '.join(title for title in self.features)))
+		# Set up actions:
+		if self.actions:
+			lines.append('Actions: {}'.format(', '.join(title for title in self.actions)))
+		# Set up attacks:
+		lines.append('Attacks:')
+		for index, attack in enumerate(self.attacks.values()):
+			lines.append(f'   {chr(ord("A") + index)}: {attack}')
+		self._combat_lines = tuple(lines)
+
 	def _set_defaults(self):
 		"""Set the default attributes for a creature."""
 		self.ac = 10
-		self.abilities = {'str': 10, 'dex': 10, 'con': 10, 'int': 10, 'wis': 10, 'cha': 10}
-		self.bonuses = {'str': 0, 'dex': 0, 'con': 0, 'int': 0, 'wis': 0, 'cha': 0}
-		self.saves = self.bonuses.copy()
+		self.ac_text, self.alignment, self.languages, self.senses, self.sub_type = '', '', '', '', ''
+		self.abilities = self.default_abilities.copy()
+		self.bonuses = self.default_bonuses.copy()
+		self.saves = self.default_bonuses.copy()
 		self.actions, self.attacks, self.features = {}, {}, {}
 		self.conditions = []
 		self.legendary, self.reactions = {}, {}
@@ -652,18 +780,83 @@ class Creature(object):
 		self.initiative, self.xp = 0, 0
 		self.description = ''
 		self.hp_roll = '20d12'
+		self._hp_parsed = (20, 12, 0)
 		self.hp, self.hp_max = 140, 140
 		self.pc = False
 		self.size = 'Medium'
-		self.skills = {skill: 0 for skill in self.skill_abilities}
+		self.skills = self.default_skills.copy()
 		self.speed = 30
 		self.other_speeds = ''
 		self.type = 'unknown'
+		# The stat block is only built if asked for.
+		self._stat_lines = None
+
+	def _set_stat_lines(self):
+		"""Set the lines of the stat block that do not change. (None)"""
+		lines = []
+		# Abilities section
+		score_bits = [f'{score} ({self.bonuses[ability]:+})' for ability, score in self.abilities.items()]
+		widths = [len(score_bit) for score_bit in score_bits]
+		title_bits = [ability.upper().ljust(width) for ability, width in zip(self.abilities, widths)]
+		line_bits = ['-' * width for width in widths]
+		lines.append('')
+		lines.append('| {} |'.format(' | '.join(title_bits)))
+		lines.append('|-{}-|'.format('-|-'.join(line_bits)))
+		lines.append('| {} |'.format(' | '.join(score_bits)))
+		lines.append('')
+		# Features Section.
+		prof_saves = {attr: bonus for attr, bonus in self.saves.items() if bonus != self.bonuses[attr]}
+		if prof_saves:
+			save_bits = [f'{attr.capitalize()} {bonus:+}' for attr, bonus in prof_saves.items()]
+			lines.append('**Saves** {}'.format(', '.join(save_bits)))
+		prof_skills = {}
+		for skill, bonus in self.skills.items():
+			if bonus != self.bonuses[Creature.skill_abilities[skill]]:
+				prof_skills[skill] = bonus
+		if prof_skills:
+			skill_bits = [f'{skill.capitalize()} {bonus:+}' for skill, bonus in prof_skills.items()]
+			lines.append('**Skills** {}'.format(', '.join(skill_bits)))
+		lines.append(f'**Senses** {self.senses}')
+		lines.append(f'**Languages** {self.languages}')
+		if self.cr >= 1:
+			lines.append(f'**Challenge** {self.cr} ({self.xp} XP)')
+		elif self.cr:
+			denom = int(round(1 / self.cr, 0))
+			lines.append(f'**Challenge** 1/{denom} ({self.xp} XP)')
+		for name, text in self.features.items():
+			text = text.replace('\n\n', '\n    ')
+			lines.append(f'**{name}**. {text}')
+		# Actions section
+		if self.actions:
+			lines.append('\n### Actions\n')
+			for name, text in self.actions.items():
+				text = text.replace('\n\n', '\n    ')
+				lines.append(f'***{name}***. {text}')
+			lines.append('')
+		# Reactions section
+		if self.reactions:
+			lines.append('\n### Reactions\n')
+			for name, text in self.reactions.items():
+				text = text.replace('\n\n', '\n    ')
+				lines.append(f'***{name}***. {text}')
+			lines.append('')
+		# Legendary ctions section
+		if self.legendary:
+			lines.append('\n### Legendary Actions\n')
+			for name, text in self.legendary.items():
+				text = text.replace('\n\n', '\n    ')
+				lines.append(f'***{name}***. {text}')
+			lines.append('')
+		# Attacks section
+		lines.append('Attacks:')
+		for index, attack in enumerate(self.attacks.values()):
+			lines.append(f'   {chr(ord("A") + index)}: {attack.full_text()}')
+		self._stat_lines = tuple(lines)
 
 	def auto_attack(self):
 		"""Do all attacks without a target. (str)"""
 		results = []
-		for attack in self.attacks.values():
+		for attack in self._attack_list:
 			damage, text = attack.attack(None)
 			results.append(f'**{attack.name}**: {text}')
 		return '\n'.join(results)
@@ -680,20 +873,19 @@ class Creature(object):
 		"""
 		# Get the attack by letter.
 		if len(name) == 1:
-			name = list(self.attacks.keys())[self.letters.index(name.upper())]
-			attack = self.attacks[name]
+			attack_index = ord(name.upper()) - ord('A')
+			if not 0 <= attack_index < len(self._attack_list):
+				raise ValueError('No such attack.')
+			attack = self._attack_list[attack_index]
 		# Get the attack by name.
 		elif name:
-			name = name.lower().replace('-', ' ')
-			for attack in self.attacks.values():
-				if attack.name.lower() == name.lower():
-					break
-			else: 
+			try:
+				attack = self._attack_names[name.lower().replace('-', ' ')]
+			except KeyError:
 				raise ValueError('No such attack.')
 		# Get the default attack.
 		else:
-			name = list(self.attacks.keys())[0]
-			attack = self.attacks[name]
+			attack = self._attack_list[0]
 		# Make the attack.
 		return attack.attack(target, advantage, temp_bonus)
 
@@ -709,24 +901,14 @@ class Creature(object):
 		speed_text = f'Speed: {self.speed} ft.'
 		if self.other_speeds:
 			speed_text = f'{speed_text}; {self.other_speeds}'
-		lines.append(speed_text)
-		lines.append(f'AC: {self.ac}')
 		if self.hp_temp:
-			lines.append(f'HP: {self.hp}+{self.hp_temp}/{self.hp_max}')
+			hp_text = f'HP: {self.hp}+{self.hp_temp}/{self.hp_max}'
 		else:
-			lines.append(f'HP: {self.hp}/{self.hp_max}')
-		lines.append('-------------------')
+			hp_text = f'HP: {self.hp}/{self.hp_max}'
+		lines.extend((speed_text, f'AC: {self.ac}', hp_text, '-------------------'))
 		#lines.extend(['', '-------------------', ''])
-		# Set up features:
-		if self.features:
-			lines.append('Features: {}'.format(', '.join(title for title in self.features)))
-		# Set up actions:
-		if self.actions:
-			lines.append('Actions: {}'.format(', '.join(title for title in self.actions)))
-		# Set up attacks:
-		lines.append('Attacks:')
-		for letter, attack in zip(self.letters, self.attacks.values()):
-			lines.append(f'   {letter}: {attack}')
+		# Add the features, actions, and attacks.
+		lines.extend(self._combat_lines)
 		# Combine the lines.
 		return '\n'.join(lines)
 
@@ -740,12 +922,53 @@ class Creature(object):
 		"""
 		if not name:
 			name = self.name
-		clone = Creature(DummyNode(name, []))
-		clone.__dict__ = self.__dict__.copy()
+		# Skip __init__, since all of the attributes are copied anyway.
+		# Each slot is assigned directly, which is much faster than a setattr loop.
+		# Any new slot must be added here.
+		clone = Creature.__new__(Creature)
+		clone._attack_list = self._attack_list
+		clone._attack_names = self._attack_names
+		clone._combat_lines = self._combat_lines
+		clone._hp_parsed = self._hp_parsed
+		clone._name_markers = self._name_markers
+		clone._stat_lines = self._stat_lines
+		clone.abilities = self.abilities
+		clone.ac = self.ac
+		clone.ac_mod = self.ac_mod
+		clone.ac_text = self.ac_text
+		clone.actions = self.actions
+		clone.alignment = self.alignment
+		clone.attacks = self.attacks
+		clone.bonuses = self.bonuses
+		clone.cr = self.cr
+		clone.description = self.description
+		clone.features = self.features
+		clone.hp = self.hp
+		clone.hp_max = self.hp_max
+		clone.hp_roll = self.hp_roll
+		clone.hp_temp = self.hp_temp
+		clone.init_bonus = self.init_bonus
+		clone.initiative = self.initiative
+		clone.languages = self.languages
+		clone.legendary = self.legendary
+		clone.other_speeds = self.other_speeds
+		clone.pc = self.pc
+		clone.reactions = self.reactions
+		clone.saves = self.saves
+		clone.senses = self.senses
+		clone.size = self.size
+		clone.skills = self.skills
+		clone.speed = self.speed
+		clone.sub_type = self.sub_type
+		clone.type = self.type
+		clone.xp = self.xp
 		clone.name = name
-		clone.conditions = self.conditions[:]
+		clone.conditions = [condition[:] for condition in self.conditions]
 		if not average_hp:
-			clone.hp = dice.roll(clone.hp_roll)
+			if clone._hp_parsed:
+				clone.hp = dice.roll_parsed(clone._hp_parsed)
+			else:
+				clone.hp = dice.roll(clone.hp_roll)
 			clone.hp_max = clone.hp
 		return clone
 
@@ -839,69 +1062,10 @@ class Creature(object):
 			lines.append(f'**Speed** {self.speed} ft., {self.other_speeds}')
 		else:
 			lines.append(f'**Speed** {self.speed} ft.')
-		# Abilities section
-		score_bits = []
-		title_bits = []
-		line_bits = []
-		for ability, score in self.abilities.items():
-			bonus = score // 2 - 5
-			plus = '+' if bonus >= 0 else ''
-			score_bits.append(f'{score} ({plus}{bonus})')
-			title_format = f'{{:<{len(score_bits[-1])}}}'
-			title_bits.append(title_format.format(ability.upper()))
-			line_bits.append('-' * len(score_bits[-1]))
-		lines.append('')
-		lines.append('| {} |'.format(' | '.join(title_bits)))
-		lines.append('|-{}-|'.format('-|-'.join(line_bits)))
-		lines.append('| {} |'.format(' | '.join(score_bits)))
-		lines.append('')
-		# Features Section.
-		prof_saves = {attr: bonus for attr, bonus in self.saves.items() if bonus != self.bonuses[attr]}
-		if prof_saves:
-			save_bits = [f'{attr.capitalize()} {bonus:+}' for attr, bonus in prof_saves.items()]
-			lines.append('**Saves** {}'.format(', '.join(save_bits)))
-		prof_skills = {}
-		for skill, bonus in self.skills.items():
-			if bonus != self.bonuses[Creature.skill_abilities[skill]]:
-				prof_skills[skill] = bonus
-		if prof_skills:
-			skill_bits = [f'{skill.capitalize()} {bonus:+}' for skill, bonus in prof_skills.items()]
-			lines.append('**Skills** {}'.format(', '.join(skill_bits)))
-		lines.append(f'**Senses** {self.senses}')
-		lines.append(f'**Languages** {self.languages}')
-		if self.cr >= 1:
-			lines.append(f'**Challenge** {self.cr} ({self.xp} XP)')
-		elif self.cr:
-			denom = int(round(1 / self.cr, 0))
-			lines.append(f'**Challenge** 1/{denom} ({self.xp} XP)')
-		for name, text in self.features.items():
-			text = text.replace('\n\n', '\n    ')
-			lines.append(f'**{name}**. {text}')
-		# Actions section
-		if self.actions:
-			lines.append('\n### Actions\n')
-			for name, text in self.actions.items():
-				text = text.replace('\n\n', '\n    ')
-				lines.append(f'***{name}***. {text}')
-			lines.append('')
-		# Reactions section
-		if self.reactions:
-			lines.append('\n### Reactions\n')
-			for name, text in self.reactions.items():
-				text = text.replace('\n\n', '\n    ')
-				lines.append(f'***{name}***. {text}')
-			lines.append('')
-		# Legendary ctions section
-		if self.legendary:
-			lines.append('\n### Legendary Actions\n')
-			for name, text in self.legendary.items():
-				text = text.replace('\n\n', '\n    ')
-				lines.append(f'***{name}***. {text}')
-			lines.append('')
-		# Attacks section
-		lines.append('Attacks:')
-		for letter, attack in zip(self.letters, self.attacks.values()):
-			lines.append(f'   {letter}: {attack.full_text()}')
+		# Add the parts that do not change, building them the first time.
+		if self._stat_lines is None:
+			self._set_stat_lines()
+		lines.extend(self._stat_lines)
 		return '\n'.join(lines)
 
 	def update_conditions(self, combatant, end_point):
@@ -912,18 +1076,20 @@ class Creature(object):
 		combatant: The name of the current combatant. (str)
 		end_point: 's' for the start of the round, 'e' for the end. (str)
 		"""
-		drop = set()
-		for con_index, condition in enumerate(self.conditions):
-			if [combatant, end_point] == condition[2:]:
+		new_conditions = []
+		for condition in self.conditions:
+			if condition[2] == combatant and condition[3] == end_point:
 				condition[1] -= 1
+				# Drop conditions that have run out.
 				if not condition[1]:
-					drop.add(con_index)
-		if drop:
-			new_conditions = []
-			for con_index, condition in enumerate(self.conditions):
-				if con_index not in drop:
-					new_conditions.append(condition)
-			self.conditions = new_conditions
+					continue
+			new_conditions.append(condition)
+		self.conditions = new_conditions
+
+	# The parser table has to come after the parsers are defined.
+	two_stars = {'Armor Class': _parse_ac, 'Challenge': _parse_challenge, 'Hit Points': _parse_hp, 
+		'Languages': _parse_languages, 'Saving Throws': _parse_saves, 'Senses': _parse_senses, 
+		'Skills': _parse_skills, 'Speed': _parse_speed}
 
 class CreatureGroup(object):
 	"""
@@ -983,29 +1149,22 @@ class CreatureGroup(object):
 	def _ac_text(self):
 		"""Text representation of individual ACs, as needed. (str)"""
 		acs = [creature.ac + creature.ac_mod for creature in self.creatures]
-		if len(set(acs)) > 1:
-			text = '/'.join([str(ac) for ac in acs])
-		else:
+		if acs.count(acs[0]) == len(acs):
 			text = str(acs[0])
+		else:
+			text = '/'.join([str(ac) for ac in acs])
 		return text
 
 	def _condition_text(self):
 		"""Text representation of inidividual condtions. (str)"""
-		con_text = []
-		for creature_index, creature in enumerate(self.creatures, start = 1):
-			if creature.conditions:
-				con_comma = ', '.join([con[0] for con in creature.conditions])
-				con_text.append(f'{creature_index}: {con_comma}')
+		con_text = [f"{creature_index}: {', '.join([con[0] for con in creature.conditions])}"
+			for creature_index, creature in enumerate(self.creatures, start = 1) if creature.conditions]
 		return '; '.join(con_text)
 
 	def _hp_text(self):
 		"""Text representation of the individual hit points. (str)"""
-		hp_text = []
-		for creature in self.creatures:
-			if creature.hp_temp:
-				hp_text.append(f'{creature.hp}+{creature.hp_temp}/{creature.hp_max}')
-			else:
-				hp_text.append(f'{creature.hp}/{creature.hp_max}')
+		hp_text = [f'{creature.hp}+{creature.hp_temp}/{creature.hp_max}' if creature.hp_temp 
+			else f'{creature.hp}/{creature.hp_max}' for creature in self.creatures]
 		return ', '.join(hp_text)
 
 	def attack(self, target, name, advantage = 0, temp_bonus = 0):
@@ -1043,20 +1202,9 @@ class CreatureGroup(object):
 		speed_text = f'Speed: {sample.speed} ft.'
 		if sample.other_speeds:
 			speed_text = f'{speed_text}; {sample.other_speeds}'
-		lines.append(speed_text)
-		lines.append(f'AC: {self._ac_text()}')
-		lines.append(f'HP: {self._hp_text()}')
-		lines.append('-------------------')
-		# Set up features:
-		if sample.features:
-			lines.append('Features: {}'.format(', '.join(title for title in sample.features)))
-		# Set up actions:
-		if sample.actions:
-			lines.append('Actions: {}'.format(', '.join(title for title in sample.actions)))
-		# Set up attacks:
-		lines.append('Attacks:')
-		for letter, attack in zip(sample.letters, sample.attacks.values()):
-			lines.append(f'   {letter}: {attack}')
+		lines.extend((speed_text, f'AC: {self._ac_text()}', f'HP: {self._hp_text()}', '-------------------'))
+		# Add the features, actions, and attacks, which the sample has already set up.
+		lines.extend(sample._combat_lines)
 		# Combine the lines.
 		return '\n'.join(lines)
 
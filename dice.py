@@ -16,20 +16,85 @@ The DICE_REGEX pattern has the following groups:
 
 Constants:
 DICE_REGEX: A regular expression for the die roll syntax. (Pattern)
+SIMPLE_REGEX: A regular expression for a die roll with a modifier. (Pattern)
 TIGHT_REGEX: A regular expression for a die roll that requires sides. (Pattern)
 
 Functions:
+_parse_expression: Parse the text for roll into terms and operators. (tuple of tuple)
+_parse_ndk: Parse the text for ndk. (tuple of int or None)
 d20: Roll a d20, possibly with advantage. (int)
 nd: Roll more than one die. (int)
+parse_roll: Parse a simple roll for repeated use. (tuple of int)
 roll: Do a complicated roll. (int or list of int)
+roll_parsed: Do a simple roll that was already parsed. (int)
 """
 
+import functools
+import itertools
 import random
 import re
 
 DICE_REGEX = re.compile(r'((\d*)x)?\s*(\d*)d(\d*)\s*(kl(\d*))?(kh(\d*))?')
+SIMPLE_REGEX = re.compile(r'\s*(\d*)d(\d+)\s*(?:([+-])\s*(\d+))?\s*$')
 TIGHT_REGEX = re.compile(r'((\d*)x)?\s*(\d*)d(\d+)\s*(kl(\d*))?(kh(\d*))?')
 
+@functools.lru_cache(maxsize = 512)
+def _parse_expression(roll_text):
+	"""
+	Parse the text for roll into terms and operators. (tuple of tuple)
+
+	The terms are ints for plain numbers and the text of any die rolls, which
+	are left for ndk to roll. The results are cached, so repeated rolls only
+	have to be parsed once.
+
+	Parameters:
+	roll_text: The text specifying the roll. (str)
+	"""
+	op_symbols = set('+-*/')
+	terms, operators = [], []
+	start = 0
+	for end, char in enumerate(roll_text):
+		if char in op_symbols:
+			text = roll_text[start:end].strip()
+			if text.isdigit():
+				terms.append(int(text))
+			elif not text and char == '-':
+				terms.append(0)
+			else:
+				terms.append(text)
+			operators.append(char)
+			start = end + 1
+	text = roll_text[start:].strip()
+	if text.isdigit():
+		terms.append(int(text))
+	else:
+		terms.append(text)
+	return tuple(terms), tuple(operators)
+
+@functools.lru_cache(maxsize = 512)
+def _parse_ndk(text):
+	"""
+	Parse the text for ndk. (tuple of int or None)
+
+	The return value is the number of repeats, the number of dice, the number of
+	sides on the dice, and how many dice to keep low and high. If the roll has
+	no sides, None is returned instead. The results are cached, since the same
+	few rolls come up over and over.
+
+	Parameters:
+	text: The text specifying the roll. (str)
+	"""
+	parsed = DICE_REGEX.match(text).groups()
+	repeat = int(parsed[1]) if parsed[1] else 1
+	number = int(parsed[2]) if parsed[2] else 1
+	try:
+		sides = int(parsed[3])
+	except ValueError:
+		return None
+	keep_low = int(parsed[5]) if parsed[5] else 0
+	keep_high = int(parsed[7]) if parsed[7] else 0
+	return repeat, number, sides, keep_low, keep_high
+
 def d20(advantage = 0):
 	"""
 	Roll a d20. (int)
@@ -41,13 +106,10 @@ def d20(advantage = 0):
 	advantage: Whether the roll is done with advantage. (int)
 	"""
 	roll = random.randint(1, 20)
-	if advantage:
-		ad_roll = random.randint(1, 20)
-		if advantage > 0:
-			roll = max(roll, ad_roll)
-		elif advantage < 0:
-			roll = min(roll, ad_roll)
-	return roll
+	if not advantage:
+		return roll
+	ad_roll = random.randint(1, 20)
+	return max(roll, ad_roll) if advantage > 0 else min(roll, ad_roll)
 
 def ndk(text):
 	"""
@@ -57,32 +119,50 @@ def ndk(text):
 	text: The text specifying the roll. (str)
 	"""
 	# Parse the roll text.
-	parsed = DICE_REGEX.match(text).groups()
-	repeat = int(parsed[1]) if parsed[1] else 1
-	number = int(parsed[2]) if parsed[2] else 1
-	try:
-		sides = int(parsed[3])
-	except ValueError:
+	parsed = _parse_ndk(text)
+	if parsed is None:
 		return 0
-	keep_low = int(parsed[5]) if parsed[5] else 0
-	keep_high = int(parsed[7]) if parsed[7] else 0
+	repeat, number, sides, keep_low, keep_high = parsed
 	# Roll the dice.
 	values = []
+	lows, highs = [1] * number, [sides] * number
 	for roll in range(repeat):
-		dice = [random.randint(1, sides) for die in range(number)]
-		if keep_high:
-			dice.sort()
-			dice = dice[-keep_high:]
-		if keep_low:
-			dice.sort()
-			dice = dice[:keep_low]
-		values.append(sum(dice))
+		if keep_high or keep_low:
+			dice = sorted(map(random.randint, lows, highs))
+			if keep_high:
+				dice = dice[-keep_high:]
+			if keep_low:
+				dice = dice[:keep_low]
+			values.append(sum(dice))
+		else:
+			values.append(sum(map(random.randint, lows, highs)))
 	# Return one or multiple values as directed.
 	if repeat == 1:
 		return values[0]
 	else:
 		return values
 
+def parse_roll(text):
+	"""
+	Parse a simple roll for repeated use. (tuple of int)
+
+	Simple rolls are a number of dice with an optional modifier, like '2d6+3'.
+	The return value is the number of dice, the number of sides on each die, and
+	the modifier. If the roll is not simple, None is returned instead.
+
+	Parameters:
+	text: The text specifying the roll. (str)
+	"""
+	match = SIMPLE_REGEX.match(text)
+	if not match:
+		return None
+	number, sides, sign, modifier = match.groups()
+	number = int(number) if number else 1
+	modifier = int(modifier) if modifier else 0
+	if sign == '-':
+		modifier = -modifier
+	return number, int(sides), modifier
+
 def roll(roll_text):
 	"""
 	Do a complicated roll. (int or list of int)
@@ -99,47 +179,37 @@ def roll(roll_text):
 	roll_text: The text specifying the roll. (str)
 	"""
 	# Parse out the values and the operators, rolling any dice that come up.
-	op_symbols = set('+-*/')
-	values, operators = [], []
-	text = ''
-	for char in roll_text:
-		if char in op_symbols:
-			text = text.strip()
-			if text.isdigit():
-				values.append(int(text))
-			elif not text and char == '-':
-				values.append(0)
-			else:
-				values.append(ndk(text))
-			operators.append(char)
-			text = ''
-		else:
-			text += char
-	text = text.strip()
-	if text.isdigit():
-		values.append(int(text))
-	else:
-		values.append(ndk(text))
-	# Handle multiplication and division.
-	new_values, new_operators = values[:1], []
+	terms, operators = _parse_expression(roll_text)
+	values = [term if isinstance(term, int) else ndk(term) for term in terms]
+	# A single value (possibly a list of repeated rolls) needs no arithmetic.
+	if not operators:
+		return values[0]
+	# Multiply or divide the current term, and add it to the total when it is done.
+	total, sign, term = 0, 1, values[0]
 	for operator, value in zip(operators, values[1:]):
 		if operator == '*':
-			new_values[-1] *= value
+			term *= value
 		elif operator == '/':
-			new_values[-1] //= value
+			term //= value
 		else:
-			new_values.append(value)
-			new_operators.append(operator)
-	# Handle addition and subtraction.
-	total = new_values[0]
-	for operator, value in zip(new_operators, new_values[1:]):
-		if operator == '+':
-			total += value
-		elif operator == '-':
-			total -= value
+			total += sign * term
+			sign, term = (1 if operator == '+' else -1), value
+	total += sign * term
 	# Return the final value.
 	return total
 
+def roll_parsed(parsed):
+	"""
+	Do a simple roll that was already parsed. (int)
+
+	Parameters:
+	parsed: The number of dice, sides, and modifier from parse_roll. (tuple of int)
+	"""
+	number, sides, modifier = parsed
+	if number == 1:
+		return random.randint(1, sides) + modifier
+	return sum(map(random.randint, itertools.repeat(1, number), itertools.repeat(sides, number))) + modifier
+
 if __name__ == '__main__':
 	tests = ['d20', '2d8', '3d6', '4d6kh3', '4d6 kh3', '5', '6x 4d6kh3', '6x4d6kh3', '2d20kl1',
 		'1d8+2', '1d8 + 2', '2 + 3', '-2', 'fred']
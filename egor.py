@@ -61,7 +61,7 @@ class Egor(cmd.Cmd):
 	round: The number of the current combat round. (int)
 	season: The current season used for weather generation. (str)
 	srd: The stored Source Resource Document for D&D. (SRD)
-	tables: Rollable tables loaded from markdown files. (dict of str: Table)
+	tables: Rollable tables loaded from markdown files. (dict or ChainMap of str: Table)
 	tags: Tags for notes stored by the DM. (dict of str: list)
 		For each tag, this dict has a list of indices to self.notes.
 	time: The current game time. (gtime.Time)
@@ -70,14 +70,19 @@ class Egor(cmd.Cmd):
 	weather_roll: The roll specification for generating weather. (str)
 	xp: The xp earned by the party since the last distribution. (int)
 	xp_method: The method for calculating experience points. (str)
-	zoo: The creatures loaded for combat. (dict of str: Creature)
+	zoo: The creatures loaded for combat. (dict or ChainMap of str: Creature)
 
 	Class Attributes:
 	aliases: Different names for commands. (dict of str: str)
+	all_traits: All of the personality characteristics. (list of str)
+	command_help: Cleaned up command docstrings, as they are used. (dict of str: str)
 	help_text: Additional help text. (dict of str: str)
-	on_off_options: The options that are flags. (list of str)
+	on_off_options: The options that are flags, and their attributes. (dict of str: str)
+	personality_types: The labels and choices for each personality type. (dict of str: tuple)
+	skill_names: The skills in alphabetical order. (list of str)
 	tag_regex: A regular expression for note tags. (Pattern)
 	time_vars: Variables for game time and alarms. (dict of str: str)
+	topic_lines: The wrapped list of help topics, once it is built. (list of str)
 
 	Methods:
 	add_encounter: Add an encounter to the initiative tracking. (None)
@@ -147,14 +152,21 @@ class Egor(cmd.Cmd):
 	aliases = {'@': 'attack', '@@': 'autoattack', '&': 'note', '*': 'repeat', 'auto': 'autoattack', 
 		'camp': 'campaign', 'con': 'condition', 'init': 'initiative', 'n': 'next', 'op': 'opportunity', 
 		'q': 'quit', 'r': 'roll', 't': 'time', 'uncon': 'uncondition'}
+	all_traits = text.BONDS + text.FLAWS + text.GOALS + text.IDEALS + text.TRAITS
+	command_help = {}
 	intro = 'Welcome, Master of Dungeons.\nI am Egor, allow me to assist you.\n'
 	help_text = {'conditions': text.HELP_CONDITIONS, 'cover': text.HELP_SIGHT, 'help': text.HELP_GENERAL, 
 		'sight': text.HELP_SIGHT}
-	on_off_options = ('auto-attack', 'auto-kill', 'auto-save', 'average-hp', 'dex-tiebreak', 'group-hp', 
-		'random-tiebreak')
+	on_off_options = {'auto-attack': 'auto_attack', 'auto-kill': 'auto_kill', 'auto-save': 'auto_save', 
+		'average-hp': 'average_hp', 'dex-tiebreak': 'dex_tiebreak', 'group-hp': 'group_hp', 
+		'random-tiebreak': 'random_tiebreak'}
+	personality_types = {'bond': ('Bond', text.BONDS), 'flaw': ('Flaw', text.FLAWS), 'goal': ('Goal', text.GOALS), 
+		'ideal': ('Ideal', text.IDEALS), 'trait': ('Trait', text.TRAITS)}
 	prompt = 'Yes, master? '
+	skill_names = sorted(creature.Creature.skill_abilities)
 	tag_regex = re.compile(r'[a-zA-Z0-9\-]+')
 	time_vars = {'combat': '10', 'long-rest': '8:00', 'room': '10', 'short-rest': '60'}
+	topic_lines = None
 
 	def add_encounter(self, encounter):
 		"""
@@ -190,22 +202,32 @@ class Egor(cmd.Cmd):
 		Parameters:
 		time_spec: The user input that changed the time. (str)
 		"""
+		done = False
 		for alarm in self.alarms:
 			alarm.check(time_spec, self.time)
-		self.alarms = [alarm for alarm in self.alarms if not alarm.done]
+			done = done or alarm.done
+		# Only rebuild the alarm list if an alarm has finished.
+		if done:
+			self.alarms = [alarm for alarm in self.alarms if not alarm.done]
 
 	def combat_text(self):
 		"""Print a summary of the current combat. (None)"""
+		# Gather the text so that it is all printed at once.
+		current = self.init[self.init_count]
+		lines = []
 		if self.init_count == 0:
-			print(self.voice['new-round'].format(self.round))
-		print(self.init[self.init_count].combat_text())
-		if self.auto_attack and not self.init[self.init_count].pc:
-			print('-------------------')
-			print(self.init[self.init_count].auto_attack())
-		print('-------------------\n')
-		by_number = list(enumerate((str(combatant) for combatant in self.init), start = 1))
-		for index, combatant in by_number[(self.init_count + 1):] + by_number[:self.init_count]:
-			print(f'{index}: {combatant}')
+			lines.append(self.voice['new-round'].format(self.round))
+		lines.append(current.combat_text())
+		if self.auto_attack and not getattr(current, 'pc', False):
+			lines.append('-------------------')
+			lines.append(current.auto_attack())
+		lines.append('-------------------\n')
+		# List everyone else, starting with whoever acts next.
+		init_len = len(self.init)
+		for offset in range(1, init_len):
+			index = (self.init_count + offset) % init_len
+			lines.append(f'{index + 1}: {self.init[index]}')
+		print('\n'.join(lines))
 
 	def default(self, line):
 		"""
@@ -214,14 +236,12 @@ class Egor(cmd.Cmd):
 		Parameters:
 		line: The command entered by the user. (str)
 		"""
-		words = line.split()
-		if words[0] in self.aliases:
-			words[0] = self.aliases[words[0]]
-			return self.onecmd(' '.join(words))
+		lower_line = line.lower()
+		# Check the time variables before the dice regex, which matches any 'd'.
+		if lower_line in self.time_vars:
+			self.do_time(lower_line)
 		elif dice.DICE_REGEX.search(line):
 			self.do_roll(line)
-		elif line.lower() in self.time_vars:
-			self.do_time(line.lower())
 		else:
 			return super().default(line)
 
@@ -335,8 +355,8 @@ class Egor(cmd.Cmd):
 			# Handle attack errors.
 			print(self.voice['error-attack'].format(attacker.name, attack))
 			print(self.voice['list-attacks'].format(attacker.name))
-			for letter, attack in zip(creature.Creature.letters, attacker.attacks):
-				print(f'   {letter}: {attack}')
+			for index, attack in enumerate(attacker.attacks):
+				print(f'   {chr(ord("A") + index)}: {attack}')
 		else:
 			# Check for automatic kills.
 			if target.hp == 0 and self.auto_kill and not target.pc:
@@ -536,15 +556,19 @@ class Egor(cmd.Cmd):
 		elif not topic:
 			# Show the base help text.
 			print(self.help_text['help'].strip())
-			# Get the names of other help topics.
-			names = [name[3:] for name in dir(self.__class__) if name.startswith('do_')]
-			names.extend([name[5:] for name in dir(self.__class__) if name.startswith('help_')])
-			names.extend(self.help_text.keys())
-			# Clean up the names.
-			names = list(set(names) - set(('debug', 'help', 'text')))
-			names.sort()
-			# Convert the names to cleanly wrapped text and output.
-			name_lines = textwrap.wrap(', '.join(names), width = 79)
+			# Get the names of other help topics, which only need to be found once.
+			if self.topic_lines is None:
+				names = set(self.help_text)
+				for name in self.get_names():
+					if name.startswith('do_'):
+						names.add(name[3:])
+					elif name.startswith('help_'):
+						names.add(name[5:])
+				# Clean up the names.
+				names = sorted(names - {'debug', 'help', 'text'})
+				# Convert the names to cleanly wrapped text.
+				self.__class__.topic_lines = textwrap.wrap(', '.join(names), width = 79)
+			name_lines = self.topic_lines
 			if name_lines:
 				print()
 				print(self.voice['more-help'])
@@ -557,9 +581,11 @@ class Egor(cmd.Cmd):
 				return True
 		# Method docstrings are given for recognized commands.
 		elif hasattr(self, 'do_' + topic):
-			help_text = getattr(self, 'do_' + topic).__doc__
-			help_text = textwrap.dedent(help_text).strip()
-			print(help_text)
+			# Clean up each docstring the first time it is asked for.
+			if topic not in self.command_help:
+				help_text = getattr(self, 'do_' + topic).__doc__
+				self.command_help[topic] = textwrap.dedent(help_text).strip()
+			print(self.command_help[topic])
 		# Display default text for unknown arguments.
 		else:
 			print(self.voice['error-help'])
@@ -681,14 +707,11 @@ class Egor(cmd.Cmd):
 		# Otherwise get the monsters from the DM.
 		else:
 			self.get_combatants()
-		# Sort by the initiative rolls.
+		# Sort by the initiative rolls, keeping the current point in combat if adding.
+		current = self.init[self.init_count] if add else None
+		self.init.sort(key = self.init_sorter, reverse = True)
 		if add:
-			# Save the current point in combat, if adding to the combat.
-			current = self.init[self.init_count]
-			self.init.sort(key = self.init_sorter, reverse = True)
 			self.init_count = self.init.index(current)
-		else:
-			self.init.sort(key = self.init_sorter, reverse = True)
 		# Inform the DM of the initiative start.
 		print()
 		self.combat_text()
@@ -701,8 +724,9 @@ class Egor(cmd.Cmd):
 		"""
 		# Find the creature.
 		dead = self.get_creature(arguments.lower(), 'combat')
+		dead_name = dead.name.lower()
 		for death_index, living in enumerate(self.init):
-			if living.name.lower() == dead.name.lower():
+			if living.name.lower() == dead_name:
 				remove = True
 				break
 			elif isinstance(living, creature.CreatureGroup) and dead in living.creatures:
@@ -787,9 +811,8 @@ class Egor(cmd.Cmd):
 		"""
 		Creates a full random NPC.
 		"""
-		culture = random.choice(list(self.campaign.names.keys()))
-		while culture == 'formats':
-			culture = random.choice(list(self.campaign.names.keys()))
+		cultures = [name for name in self.campaign.names if name != 'formats']
+		culture = random.choice(cultures)
 		gender = random.choice(list(self.campaign.names[culture]['formats'].keys()))
 		self.do_name(f'{culture} {gender}')
 		print(gender, culture, random.choice(text.CLASSES))
@@ -858,26 +881,15 @@ class Egor(cmd.Cmd):
 		arguments = arguments.strip().lower()
 		# Handle full NPC traits.
 		if not arguments:
-			print(f'Bond: {random.choice(text.BONDS)}.')
-			print(f'Flaw: {random.choice(text.FLAWS)}.')
-			print(f'Goal: {random.choice(text.GOALS)}.')
-			print(f'Ideal: {random.choice(text.IDEALS)}.')
-			print(f'Trait: {random.choice(text.TRAITS)}.')
+			types = self.personality_types.values()
+			print('\n'.join(f'{label}: {random.choice(traits)}.' for label, traits in types))
 		# Handle specific NPC traits.
-		elif arguments == 'bond':
-			print(f'Bond: {random.choice(text.BONDS)}.')
-		elif arguments == 'flaw':
-			print(f'Flaw: {random.choice(text.FLAWS)}.')
-		elif arguments == 'goal':
-			print(f'Goal: {random.choice(text.GOALS)}.')
-		elif arguments == 'ideal':
-			print(f'Ideal: {random.choice(text.IDEALS)}.')
-		elif arguments == 'trait':
-			print(f'Trait: {random.choice(text.TRAITS)}.')
+		elif arguments in self.personality_types:
+			label, traits = self.personality_types[arguments]
+			print(f'{label}: {random.choice(traits)}.')
 		# Handle general NPC traits.
 		elif arguments.isdigit():
-			all_traits = text.BONDS + text.FLAWS + text.GOALS + text.IDEALS + text.TRAITS
-			print('\n'.join(random.choices(all_traits, k = int(arguments))))
+			print('\n'.join(random.choices(self.all_traits, k = int(arguments))))
 		# Handle unknown NPC traits.
 		else:
 			print(self.voice['error-personality'])
@@ -942,9 +954,10 @@ class Egor(cmd.Cmd):
 		# Get the target.
 		target = self.get_creature(target)
 		# Check for dis/advantage.
-		if len(words) > 3 and words[3].lower() in ('ad', 'advantage'):
+		modifier = words[3].lower() if len(words) > 3 else ''
+		if modifier in ('ad', 'advantage'):
 			advantage = 1
-		elif len(words) > 3 and words[3].lower() in ('dis', 'disadvantage'):
+		elif modifier in ('dis', 'disadvantage'):
 			advantage = -1
 		else:
 			advantage = 0
@@ -991,11 +1004,12 @@ class Egor(cmd.Cmd):
 		option, setting = arguments.split(None, 1)
 		option = option.lower()
 		if option in self.on_off_options:
-			attr = option.replace('-', '_')
-			if setting.strip() in text.YES:
+			attr = self.on_off_options[option]
+			setting = setting.strip()
+			if setting in text.YES:
 				setattr(self, attr, True)
 				print(self.voice['confirm-on'].format(option))
-			elif setting.strip() in text.NO:
+			elif setting in text.NO:
 				setattr(self, attr, False)
 				print(self.voice['confirm-off'].format(option))
 			else:
@@ -1114,12 +1128,10 @@ class Egor(cmd.Cmd):
 				ability = word
 		# Ask for the skill in no recognized skill was in the arguments.
 		if not skill:
-			skills = list(creature.Creature.skill_abilities.keys())
-			skills.sort()
-			for skill_index, skill in enumerate(skills, start = 1):
+			for skill_index, skill in enumerate(self.skill_names, start = 1):
 				print(f'{skill_index}: {skill}')
 			choice = input(self.voice['choose-skill'])
-			skill = skills[int(choice)]
+			skill = self.skill_names[int(choice)]
 			print()
 		# Make the skill check.
 		for target in targets:
@@ -1159,19 +1171,20 @@ class Egor(cmd.Cmd):
 	def do_store(self, arguments):
 		"""Save the current data."""
 		# Save the application data.
+		lines = []
+		# Save the on/off settings.
+		for option, attr in self.on_off_options.items():
+			lines.append(f'{option}: {getattr(self, attr)}')
+		# Save the loaded campaign, if any.
+		if self.campaign_folder:
+			lines.append(f'campaign: {self.campaign_folder}')
+		# Save the loaded meta-campaign, if any.
+		if self.meta_folder:
+			lines.append(f'meta: {self.meta_folder}')
+		# Save the system voice.
+		lines.append(f"voice: {self.voice['__name__']}")
 		with open(os.path.join(self.location, 'dm.dat'), 'w') as data_file:
-			# Save the on/off settings.
-			for option in self.on_off_options:
-				attr = option.replace('-', '_')
-				data_file.write('{}: {}\n'.format(option, getattr(self, attr)))
-			# Save the loaded campaign, if any.
-			if self.campaign_folder:
-				data_file.write('campaign: {}\n'.format(self.campaign_folder))
-			# Save the loaded meta-campaign, if any.
-			if self.meta_folder:
-				data_file.write('meta: {}\n'.format(self.meta_folder))
-			# Save the system voice.
-			data_file.write('voice: {}\n'.format(self.voice['__name__']))
+			data_file.write('\n'.join(lines) + '\n')
 		# Determine where the campaign data should be stored.
 		if self.campaign_folder:
 			path = os.path.join(self.location, self.campaign_folder, 'camp.dat')
@@ -1180,39 +1193,40 @@ class Egor(cmd.Cmd):
 			path = os.path.join(self.location, 'dm.dat')
 			mode = 'a'
 		# Store the campaign specific data.
+		lines = []
+		# Save the alarms.
+		for alarm in self.alarms:
+			lines.append(f'alarm: {alarm.data()}')
+		# Save the notes with tags (allows deleting notes w/o messing up tags).
+		note_tags = [[] for note in self.notes]
+		for tag, indices in self.tags.items():
+			for index in indices:
+				note_tags[index].append(tag)
+		for note, tags in zip(self.notes, note_tags):
+			if tags:
+				lines.append(f"note: {note} | {' '.join(tags)}")
+			else:
+				lines.append(f'note: {note}')
+		# Save the time data.
+		lines.append(f'time: {self.time.short()}')
+		for var, value in self.time_vars.items():
+			lines.append(f'time-var: {var} {value}')
+		# Save any encounters.
+		for name, bad_guys in self.encounters.items():
+			bad_texts = [f'{name}, {count}, {group}' for name, count, group in bad_guys]
+			lines.append(f"encounter: {name} = {'; '.join(bad_texts)}")
+		# Save the weather data.
+		lines.append(f'climate: {self.climate}')
+		lines.append(f'season: {self.season}')
+		lines.append(f'weather-roll: {self.weather_roll}')
+		# Save the experience points.
+		lines.append(f'xp: {self.xp}')
+		lines.append(f'xp-method: {self.xp_method}')
+		# Save any pc mock ups created in the interface.
+		for pc_data in self.pc_data.values():
+			lines.append(f"pc-data: {'; '.join(pc_data)}")
 		with open(path, mode) as data_file:
-			# Save the alarms.
-			for alarm in self.alarms:
-				data_file.write('alarm: {}\n'.format(alarm.data()))
-			# Save the notes with tags (allows deleting notes w/o messing up tags).
-			save_notes = [f'note: {note}' for note in self.notes]
-			for tag, indices in self.tags.items():
-				for index in indices:
-					if '|' not in save_notes[index]:
-						save_notes[index] += ' |'
-					save_notes[index] += f' {tag}'
-			for note in save_notes:
-				data_file.write(note + '\n')
-			# Save the time data.
-			data_file.write('time: {}\n'.format(self.time.short()))
-			for var, value in self.time_vars.items():
-				data_file.write('time-var: {} {}\n'.format(var, value))
-			# Save any encounters.
-			if self.encounters:
-				for name, bad_guys in self.encounters.items():
-					bad_texts = [f'{name}, {count}, {group}' for name, count, group in bad_guys]
-					enc_text = 'encounter: {} = {}\n'.format(name, '; '.join(bad_texts))
-					data_file.write(enc_text)
-			# Save the weather data.
-			data_file.write('climate: {}\n'.format(self.climate))
-			data_file.write('season: {}\n'.format(self.season))
-			data_file.write('weather-roll: {}\n'.format(self.weather_roll))
-			# Save the experience points.
-			data_file.write('xp: {}\n'.format(self.xp))
-			data_file.write('xp-method: {}\n'.format(self.xp_method))
-			# Save any pc mock ups created in the interface.
-			for pc_data in self.pc_data.values():
-				data_file.write('pc-data: {}\n'.format('; '.join(pc_data)))
+			data_file.write('\n'.join(lines) + '\n')
 		# Clean up.
 		self.changes = False
 		print(self.voice['confirm-store'])
@@ -1232,9 +1246,9 @@ class Egor(cmd.Cmd):
 				print(note)
 		elif arguments.startswith('$'):
 			# Subset notes with a regular expression.
-			note_regex = re.compile(arguments[1:])
+			note_regex = re.compile(arguments[1:], re.IGNORECASE)
 			for note in self.notes:
-				if note_regex.search(note, re.IGNORECASE):
+				if note_regex.search(note):
 					print(note)
 		else:
 			# Subset notes with a tag.
@@ -1288,9 +1302,7 @@ class Egor(cmd.Cmd):
 					break
 		# Handle requests for a list of tables.
 		elif name == 'list':
-			names = [name.title() for name in self.tables.keys()]
-			names.sort()
-			print('\n'.join(names))
+			print('\n'.join(sorted(name.title() for name in self.tables)))
 		# Handle unknown tables.
 		else:
 			print(self.voice['error-table'].format(arguments))
@@ -1460,8 +1472,9 @@ class Egor(cmd.Cmd):
 			else:
 				count = 1
 			# Find the monster's stats.
-			if name.lower() in self.zoo:
-				data = self.zoo[name.lower()]
+			low_name = name.lower()
+			if low_name in self.zoo:
+				data = self.zoo[low_name]
 			else:
 				# Ask for the initiative bonus if you can't find it.
 				init = input(self.voice['set-init-bonus'].format(name))
@@ -1471,7 +1484,7 @@ class Egor(cmd.Cmd):
 				else:
 					continue
 			# Check for previous combatants with the same name.
-			old_names = [old_name for old_name in self.combatants if old_name.startswith(name.lower())]
+			old_names = [old_name for old_name in self.combatants if old_name.startswith(low_name)]
 			if old_names:
 				tails = [old_name.split('-')[-1] for old_name in old_names]
 				tails = [int(tail) for tail in tails if tail.isdigit()]
@@ -1586,20 +1599,17 @@ class Egor(cmd.Cmd):
 		"""
 		folder = self.meta_folder if meta else self.campaign_folder
 		campaign = markdown.SRD(os.path.join(self.location, folder))
-		# Set the data from the SRD.
-		self.tables = self.srd.tables.copy()
-		self.zoo = self.srd.zoo.copy()
-		self.pcs = self.pc_data.copy()
-		# Update the SRD data based on what was just loaded.
-		self.tables.update(campaign.tables)
-		self.zoo.update(campaign.zoo)
-		self.pcs.update(campaign.pcs)
-		# Update the combined data based on what was not overwritten by the current load.
+		# Layer the SRD data, then what was just loaded, then what was not overwritten by the current load.
+		layers = [self.srd, campaign]
 		untouched = self.campaign if meta else self.meta
 		if untouched:
-			self.tables.update(untouched.tables)
-			self.zoo.update(untouched.zoo)
-			self.pcs.update(untouched.pcs)
+			layers.append(untouched)
+		# Look tables and monsters up through the layers instead of copying the SRD.
+		self.tables = collections.ChainMap(*[layer.tables for layer in reversed(layers)])
+		self.zoo = collections.ChainMap(*[layer.zoo for layer in reversed(layers)])
+		self.pcs = self.pc_data.copy()
+		for layer in layers[1:]:
+			self.pcs.update(layer.pcs)
 		# Update the calendar
 		if campaign.calendar:
 			self.calendar = campaign.calendar
@@ -1616,17 +1626,17 @@ class Egor(cmd.Cmd):
 		# Load the general application data.
 		with open(os.path.join(self.location, 'dm.dat')) as data_file:
 			for line in data_file:
-				tag, data = line.split(':', 1)
+				tag, colon, data = line.partition(':')
+				data = data.strip()
 				if tag == 'campaign':
-					self.campaign_folder = data.strip()
+					self.campaign_folder = data
 				elif tag == 'meta':
-					self.meta_folder = data.strip()
+					self.meta_folder = data
 				elif tag == 'voice':
-					self.voice = getattr(voice, data.strip().upper())
+					self.voice = getattr(voice, data.upper())
 					self.prompt = self.voice['prompt']
 				elif tag in self.on_off_options:
-					attr = tag.replace('-', '_')
-					setattr(self, attr, data.strip() == 'True')
+					setattr(self, self.on_off_options[tag], data == 'True')
 		# Determine where any campaign data is stored.
 		if self.campaign_folder:
 			path = os.path.join(self.location, self.campaign_folder, 'camp.dat')
@@ -1635,11 +1645,12 @@ class Egor(cmd.Cmd):
 		# Load the campaign specific data.
 		with open(path) as data_file:
 			for line in data_file:
-				tag, data = line.split(':', 1)
+				tag, colon, data = line.partition(':')
+				data = data.strip()
 				if tag == 'alarm':
-					self.alarms.append(gtime.Alarm.from_data(data.strip()))
+					self.alarms.append(gtime.Alarm.from_data(data))
 				elif tag == 'climate':
-					self.climate = data.strip()
+					self.climate = data
 				elif tag == 'encounter':
 					name, bad_guys = data.split('=')
 					name = name.strip()
@@ -1650,23 +1661,23 @@ class Egor(cmd.Cmd):
 						group = group.strip().lower() == 'True'
 						self.encounters[name].append((bad_name.strip(), count.strip(), group))
 				elif tag == 'note':
-					self.new_note(data.strip())
+					self.new_note(data)
 				elif tag == 'pc-data':
 					pc_data = tuple(word.strip() for word in data.split(';'))
 					self.new_pc(pc_data)
 				elif tag == 'season':
-					self.season = data.strip()
+					self.season = data
 				elif tag == 'time':
-					self.time = gtime.Time.from_str(data.strip())
+					self.time = gtime.Time.from_str(data)
 				elif tag == 'time-var':
 					var, value = data.split()
 					self.time_vars[var] = value
 				elif tag == 'weather-roll':
-					self.weather_roll = data.strip()
+					self.weather_roll = data
 				elif tag == 'xp':
 					self.xp = int(data)
 				elif tag == 'xp-method':
-					self.xp_method = data.strip()
+					self.xp_method = data
 
 	def markdown_search(self, arguments, *documents):
 		"""
@@ -1761,6 +1772,10 @@ class Egor(cmd.Cmd):
 		Parameters:
 		line: The line with the user's command. (str)
 		"""
+		# Expand any alias at the start of the command.
+		command, space, arguments = line.lstrip().partition(' ')
+		if command in self.aliases:
+			line = f'{self.aliases[command]}{space}{arguments}'
 		# Catch errors and print the traceback.
 		try:
 			return super().onecmd(line)
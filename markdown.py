@@ -117,7 +117,8 @@ class HeaderNode(Node):
 		sub_heads = [child for child in self.children if isinstance(child, HeaderNode)]
 		# Search based on regular expression or text
 		if isinstance(terms, str):
-			matches = [child for child in sub_heads if terms.lower() == child.name.lower()]
+			lower_terms = terms.lower()
+			matches = [child for child in sub_heads if lower_terms == child.name.lower()]
 		else:
 			matches = [child for child in sub_heads if terms.search(child.name)]
 		# Continue the search depth first.
@@ -15,8 +15,10 @@ HELP_CONDITIONS: Summaries of the various conditions. (str)
 HELP_GENERAL: The general help text for Egor. (str)
 HELP_SIGHT: Help text for vision and cover. (str)
 IDEALS: Possible personality ideals. (list of str)
+NO: Responses that count as no. (frozenset of str)
 STRONG_WIND: A warning about high winds. (str)
 TRAITS: Possible personality traits. (list of str)
+YES: Responses that count as yes. (frozenset of str)
 """
 
 BONDS = ['Duty to their students', 'Family first', 'Fear of someone they hurt', 'Forbidden love', 
@@ -241,7 +243,7 @@ IDEALS = ['Avoids hurting the poor', 'Beauty is truth', 'Believes they have a de
 	'The world changes and we must adapt to the changes', 'To thine own self be true', 'Values bold action', 
 	'Values creativity', 'Works for the redemption of others']
 
-NO = ('false', '0', 'no', 'f', 'off', 'n', 'nyet')
+NO = frozenset(('false', '0', 'no', 'f', 'off', 'n', 'nyet'))
 
 STRONG_WIND = """
 WARNING: Ranged attacks and hearing perception checks are at disadvantage. Open
@@ -271,4 +273,4 @@ TRAITS = ['Absent minded', 'Always has a backup plan', 'Always helps those in tr
 	'Very used to fine living', 'Wants to be the center of attention', 'Wants to know how things work', 
 	'Work hard, play hard']
 
-YES = ('true', '1', 'yes', 'on', 't', 'y', 'da')
\ No newline at end of file
+YES = frozenset(('true', '1', 'yes', 'on', 't', 'y', 'da'))
\ No newline at end of file